@@ -1,31 +1,66 @@
 from function_definitions import *
 
-cellNumber = 180 #unitless
-transversePitch = 20 #mm
-longitudinalPitch = 18.536 #mm
-cellDiameter = 18.5 #mm
-cellLength = .32535 #m
-numberLongitudinal = 45 #unitless
-numberTransverse = 4 #unitless
-freestreamTemp = 30 #Celsius
-velocity = 2.5 #m/s
-surfaceTemp = 60 #Celsius
-arrangement = "aligned" #"staggered" or "aligned"
-diametricalPitch = 0 #mm, if aligned, say this is zero
-
-
-fluidDensity = calculateFluidDensity(surfaceTemp, freestreamTemp)
-correctionFactor = correctionFactorCalc(arrangement, 10)
-dynamicViscosity = calculateDynamicViscosity(surfaceTemp, freestreamTemp)
-maxReynolds = findMaxReynolds(fluidDensity, cellDiameter, dynamicViscosity, transversePitch, velocity, diametricalPitch)
-freestreamPrandtl, surfacePrandtl, filmPrandtl = prandtlNumberCalculation(surfaceTemp, freestreamTemp, 45)
-constantOne, constantTwo = constantCalculation(maxReynolds, transversePitch, longitudinalPitch, arrangement)
-nusseltNumber = nusseltNumberCalculation(constantOne, constantTwo, maxReynolds, surfacePrandtl, freestreamPrandtl, surfaceTemp, freestreamTemp, correctionFactor)
-fluidThermalConductivity = fluidThermalConductivityCalculation(surfaceTemp, freestreamTemp)
-hBar = calculateAverageConvectiveCoefficient(fluidThermalConductivity, cellDiameter, nusseltNumber)
-specificHeat = calculateFluidSpecificHeat(surfaceTemp, freestreamTemp)
-exitTemp = calculateExitTemp(cellDiameter, cellNumber, hBar, fluidDensity, velocity, numberTransverse, transversePitch, specificHeat, surfaceTemp, freestreamTemp)
-logMeanTempDif = calculateLogMeanTempDifference(surfaceTemp, freestreamTemp, exitTemp)
-totalHeatTransfer = calculateTotalHeatTransfer(cellNumber, hBar, cellDiameter, logMeanTempDif, cellLength)
-print("Exit temperature of the air:" + str(exitTemp))
-print("Total heat transfer:" + str(totalHeatTransfer))
\ No newline at end of file
+
+def runCase(cellNumber: float, transversePitch: float, longitudinalPitch: float, cellDiameter: float,
+            cellLength: float, numberTransverse: float, freestreamTemp: float, velocity: float,
+            surfaceTemp: float, arrangement: str, diametricalPitch: float = 0) -> typing.Tuple[float, float]:
+    """
+    Runs the full heat transfer pipeline for one pack geometry, prints the results and
+    returns them, so parameter sweeps can call this once per design case.
+    :param cellNumber: float (unitless)
+    :param transversePitch: float (mm)
+    :param longitudinalPitch: float (mm)
+    :param cellDiameter: float (mm)
+    :param cellLength: float (m)
+    :param numberTransverse: float (unitless)
+    :param freestreamTemp: float (celsius)
+    :param velocity: float (m/s)
+    :param surfaceTemp: float (celsius)
+    :param arrangement: str (aligned or staggered)
+    :param diametricalPitch: float (mm & optional, zero if aligned)
+    :return: Tuple [exitTemp, totalHeatTransfer] (celsius, W)
+    """
+    filmTemp = (surfaceTemp + freestreamTemp) / 2 #Celsius, computed once so the property lookups share it
+    #mm to m conversions done once here so the helpers all work in SI units
+    cellDiameterM = cellDiameter / 1000
+    transversePitchM = transversePitch / 1000
+    longitudinalPitchM = longitudinalPitch / 1000
+    diametricalPitchM = diametricalPitch / 1000
+
+    fluidDensity, dynamicViscosity, fluidThermalConductivity, specificHeat, filmPrandtl = calculateFilmProperties(filmTemp)
+    correctionFactor = correctionFactorCalc(arrangement, 10)
+    maxReynolds = findMaxReynolds(fluidDensity, cellDiameterM, dynamicViscosity, transversePitchM, velocity, diametricalPitchM)
+    freestreamPrandtl, surfacePrandtl, _ = prandtlNumberCalculation(surfaceTemp, freestreamTemp)
+    constantOne, constantTwo = constantCalculation(maxReynolds, transversePitchM, longitudinalPitchM, arrangement)
+    nusseltNumber = nusseltNumberCalculation(constantOne, constantTwo, maxReynolds, surfacePrandtl, freestreamPrandtl, filmPrandtl, correctionFactor)
+    hBar = calculateAverageConvectiveCoefficient(fluidThermalConductivity, cellDiameterM, nusseltNumber)
+    exitTemp = calculateExitTemp(cellDiameterM, cellNumber, hBar, fluidDensity, velocity, numberTransverse, transversePitchM, specificHeat, surfaceTemp, freestreamTemp)
+    logMeanTempDif = calculateLogMeanTempDifference(surfaceTemp, freestreamTemp, exitTemp)
+    totalHeatTransfer = calculateTotalHeatTransfer(cellNumber, hBar, cellDiameterM, logMeanTempDif, cellLength)
+    print("Exit temperature of the air:" + str(exitTemp))
+    print("Total heat transfer:" + str(totalHeatTransfer))
+    return exitTemp, totalHeatTransfer
+
+
+# Each entry is one pack design to evaluate; add dicts here to sweep designs.
+CASES = [
+    {"cellNumber": 180, #unitless
+     "transversePitch": 20, #mm
+     "longitudinalPitch": 18.536, #mm
+     "cellDiameter": 18.5, #mm
+     "cellLength": .32535, #m
+     "numberTransverse": 4, #unitless
+     "freestreamTemp": 30, #Celsius
+     "velocity": 2.5, #m/s
+     "surfaceTemp": 60, #Celsius
+     "arrangement": "aligned", #"staggered" or "aligned"
+     "diametricalPitch": 0}, #mm, if aligned, say this is zero
+]
+
+def main():
+    for case in CASES:
+        runCase(**case)
+
+
+if __name__ == "__main__":
+    main()
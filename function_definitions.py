@@ -1,6 +1,152 @@
+import bisect
+import functools
 import typing
-import numpy
-from math import log, exp
+from math import log, exp, expm1, pi
+
+
+def _buildInterpTable(celsiusDataPoints: list, valueDataPoints: list) -> tuple:
+    """
+    Packs a property table into tuples and precomputes the slope of each segment,
+    so interpolation at lookup time is a single multiply-add.
+    :param celsiusDataPoints: list (celsius, ascending)
+    :param valueDataPoints: list (property units)
+    :return: Tuple [celsiusDataPoints, valueDataPoints, slopes]
+    """
+    slopes = tuple((valueDataPoints[i + 1] - valueDataPoints[i]) / (celsiusDataPoints[i + 1] - celsiusDataPoints[i])
+                   for i in range(len(celsiusDataPoints) - 1))
+    return tuple(celsiusDataPoints), tuple(valueDataPoints), slopes
+
+
+def _interp1d(x: float, table: tuple) -> float:
+    """
+    Scalar linear interpolation into a table built by _buildInterpTable. Clamps to the
+    table endpoints like numpy.interp, but skips the NumPy dispatch overhead, which
+    dwarfs the actual arithmetic for tables this small.
+    :param x: float (celsius)
+    :param table: tuple (from _buildInterpTable)
+    :return: float (property units)
+    """
+    celsiusDataPoints, valueDataPoints, slopes = table
+    if x <= celsiusDataPoints[0]:
+        return valueDataPoints[0]
+    if x >= celsiusDataPoints[-1]:
+        return valueDataPoints[-1]
+    i = bisect.bisect_right(celsiusDataPoints, x) - 1
+    return valueDataPoints[i] + slopes[i] * (x - celsiusDataPoints[i])
+
+
+# Property tables are built once at import so lookups do no per-call allocation.
+# Values taken from the Engineering Toolbox website.
+_PRANDTL_TABLE = _buildInterpTable([0.0,
+                                    6.9,
+                                    15.6,
+                                    26.9,
+                                    46.9,
+                                    66.9,
+                                    86.9,
+                                    106.9,
+                                    126.9],
+                                   [0.711,
+                                    0.710,
+                                    0.709,
+                                    0.707,
+                                    0.705,
+                                    0.703,
+                                    0.701,
+                                    0.700,
+                                    0.699])
+# The dynamic viscosity, thermal conductivity and density tables share this abscissa.
+_FILM_PROPERTY_CELSIUS = [0,
+                          5,
+                          10,
+                          15,
+                          20,
+                          25,
+                          30,
+                          40,
+                          50,
+                          60,
+                          80,
+                          100,
+                          125]
+# Unit scalings are folded into the stored values, so lookups need no post-scaling:
+# dynamic viscosity is stored in Ns/m^2, thermal conductivity in w/mk and specific
+# heat in J/KgK.
+_DYNAMIC_VISCOSITY_TABLE = _buildInterpTable(_FILM_PROPERTY_CELSIUS,
+                                             [17.15e-6,
+                                              17.40e-6,
+                                              17.64e-6,
+                                              17.89e-6,
+                                              18.13e-6,
+                                              18.37e-6,
+                                              18.60e-6,
+                                              19.07e-6,
+                                              19.53e-6,
+                                              19.99e-6,
+                                              20.88e-6,
+                                              21.74e-6,
+                                              22.79e-6])
+_THERMAL_CONDUCTIVITY_TABLE = _buildInterpTable(_FILM_PROPERTY_CELSIUS,
+                                                [24.36e-3,
+                                                 24.74e-3,
+                                                 25.12e-3,
+                                                 25.50e-3,
+                                                 25.87e-3,
+                                                 26.24e-3,
+                                                 26.62e-3,
+                                                 27.35e-3,
+                                                 28.08e-3,
+                                                 28.80e-3,
+                                                 30.23e-3,
+                                                 31.62e-3,
+                                                 33.33e-3])
+_DENSITY_TABLE = _buildInterpTable(_FILM_PROPERTY_CELSIUS,
+                                   [1.292,
+                                    1.268,
+                                    1.246,
+                                    1.225,
+                                    1.204,
+                                    1.184,
+                                    1.164,
+                                    1.127,
+                                    1.093,
+                                    1.060,
+                                    1.000,
+                                    0.9467,
+                                    0.8868])
+_SPECIFIC_HEAT_TABLE = _buildInterpTable([0.0,
+                                          6.9,
+                                          15.6,
+                                          26.9,
+                                          46.9,
+                                          66.9,
+                                          86.9,
+                                          107,
+                                          127],
+                                         [1006,
+                                          1006,
+                                          1006,
+                                          1006,
+                                          1007,
+                                          1009,
+                                          1010,
+                                          1012,
+                                          1014])
+
+# The five film temperature properties are always evaluated at the same temperature, so
+# they are resampled onto the merged set of breakpoints at import. Resampling a
+# piecewise-linear table at a superset of its breakpoints is exact, and it lets
+# calculateFilmProperties find the segment once and blend all five properties with it.
+_FILM_TABLES = (_DENSITY_TABLE, _DYNAMIC_VISCOSITY_TABLE, _THERMAL_CONDUCTIVITY_TABLE, _SPECIFIC_HEAT_TABLE,
+                _PRANDTL_TABLE)
+_FILM_CELSIUS = tuple(sorted({celsius for table in _FILM_TABLES for celsius in table[0]}))
+_FILM_RESAMPLED = tuple(_buildInterpTable(_FILM_CELSIUS, [_interp1d(celsius, table) for celsius in _FILM_CELSIUS])
+                        for table in _FILM_TABLES)
+
+
+# Correction factor tables indexed by longitudinal cell number (index 0 is unused).
+_ALIGNED_CORRECTION_FACTORS = (1, .7, .8, .86, .9, .92, .935, .95, .96, .965, .97, .975, .98, .98, .983, .986, .99)
+_STAGGERED_CORRECTION_FACTORS = (1, .64, .76, .84, .89, .92, .935, .95, .96, .965, .97, .975, .98, .98, .983, .986, .99)
 
 
 def correctionFactorCalc(arrangement: str, longitudinalCellNumber: int) -> float:
@@ -11,43 +157,15 @@ def correctionFactorCalc(arrangement: str, longitudinalCellNumber: int) -> float
     :param longitudinalCellNumber: int (unitless)
     :return: float (unitless)
     """
-    correctionFactorDict = {}
     if arrangement == "aligned":
-        correctionFactorDict = {1: .7,
-                                2: .8,
-                                3: .86,
-                                4: .9,
-                                5: .92,
-                                6: .935,
-                                7: .95,
-                                8: .96,
-                                9: .965,
-                                10: .97,
-                                11: .975,
-                                12: .98,
-                                13: .98,
-                                14: .983,
-                                15: .986,
-                                16: .99}
+        correctionFactorTable = _ALIGNED_CORRECTION_FACTORS
     elif arrangement == "staggered":
-        correctionFactorDict = {1: .64,
-                                2: .76,
-                                3: .84,
-                                4: .89,
-                                5: .92,
-                                6: .935,
-                                7: .95,
-                                8: .96,
-                                9: .965,
-                                10: .97,
-                                11: .975,
-                                12: .98,
-                                13: .98,
-                                14: .983,
-                                15: .986,
-                                16: .99}
-    correctionFactor = correctionFactorDict.get(longitudinalCellNumber, 1)
-    return correctionFactor
+        correctionFactorTable = _STAGGERED_CORRECTION_FACTORS
+    else:
+        return 1
+    if 1 <= longitudinalCellNumber < len(correctionFactorTable):
+        return correctionFactorTable[longitudinalCellNumber]
+    return 1
 
 
 def findMaxReynolds(airDensity: float, cellDiameter: float, dynamicViscosity: float, transversePitch: float,
@@ -56,21 +174,32 @@ def findMaxReynolds(airDensity: float, cellDiameter: float, dynamicViscosity: fl
     This finds the maximum reynolds number in the system. If the system is staggered, diametrical pitch must be specified. Otherwise, it's default
     value is zero and is not used.
     :param airDensity: float (kg/m^3)
-    :param cellDiameter: float (mm)
+    :param cellDiameter: float (m)
     :param dynamicViscosity: float (kg/ms)
-    :param transversePitch: float (mm)
+    :param transversePitch: float (m)
     :param freestreamVelocity: float (m/s)
-    :param diametricalPitch: float (mm & optional)
+    :param diametricalPitch: float (m & optional)
     :return: float (unitless)
     """
     velocity1 = (transversePitch / (transversePitch - cellDiameter)) * freestreamVelocity
     velocity2 = (transversePitch / (2 * (diametricalPitch - cellDiameter))) * freestreamVelocity
     # this will return a negative number in the aligned case, which will me ignored by the max function used later in this function.
     velocityMax = max(velocity1, velocity2)
-    maxReynolds = (airDensity * velocityMax * cellDiameter / 1000) / dynamicViscosity
+    maxReynolds = (airDensity * velocityMax * cellDiameter) / dynamicViscosity
     return maxReynolds
 
 
+def _filmPrandtlCalculation(filmTemperature: float) -> float:
+    """
+    Looks up just the film Prandtl number, for callers that do not need the surface and
+    freestream values.
+    :param filmTemperature: float (celsius)
+    :return: float (unitless)
+    """
+    return _interp1d(filmTemperature, _PRANDTL_TABLE)
+
+
+@functools.lru_cache(maxsize=None)
 def prandtlNumberCalculation(surfaceTemperature: float, freestreamTemperature: float, filmTemperature: float = 0) \
         -> typing.Tuple[float, float, float]:
     """
@@ -81,41 +210,36 @@ def prandtlNumberCalculation(surfaceTemperature: float, freestreamTemperature: f
     :param freestreamTemperature: float (celsius)
     :return: Tuple [freestream, surface, film] (unitless)
     """
-    celsiusDataPoints = [0.0,
-                         6.9,
-                         15.6,
-                         26.9,
-                         46.9,
-                         66.9,
-                         86.9,
-                         106.9,
-                         126.9]
-    prandtlNumberDataPoints = [0.711,
-                               0.710,
-                               0.709,
-                               0.707,
-                               0.705,
-                               0.703,
-                               0.701,
-                               0.700,
-                               0.699]
-    surfacePrandtl = numpy.interp(surfaceTemperature, celsiusDataPoints, prandtlNumberDataPoints)
-    freestreamPrandtl = numpy.interp(freestreamTemperature, celsiusDataPoints, prandtlNumberDataPoints)
+    surfacePrandtl = _interp1d(surfaceTemperature, _PRANDTL_TABLE)
+    freestreamPrandtl = _interp1d(freestreamTemperature, _PRANDTL_TABLE)
     filmPrandtl = 0
 
     if filmTemperature != 0:
-        filmPrandtl = numpy.interp(filmTemperature, celsiusDataPoints, prandtlNumberDataPoints)
+        filmPrandtl = _filmPrandtlCalculation(filmTemperature)
         return freestreamPrandtl, surfacePrandtl, filmPrandtl
 
     return freestreamPrandtl, surfacePrandtl, filmPrandtl
 
 
+# Reynolds regime boundaries and the (constantOne, constantTwo) pair for each regime
+# between them. None marks the 1000 <= Re < 2e5 regime, whose constants depend on the
+# pitch ratio and are handled in constantCalculation itself.
+_REYNOLDS_MID = 2 * 10 ** 5
+_REYNOLDS_HIGH = 2 * 10 ** 6
+_REYNOLDS_BREAKPOINTS = (10, 100, 1000, _REYNOLDS_MID, _REYNOLDS_HIGH)
+_ALIGNED_CONSTANTS = ((.8, .4), (0, 0), None, (.021, .84))
+_STAGGERED_CONSTANTS = ((.9, .4), (0, 0), None, (.022, .84))
+
+_ONE_THIRD = 1 / 3
+
+
 def constantCalculation(maxReynolds: float, transversePitch: float, longitudinalPitch: float, arrangement: str) -> \
         typing.Tuple[float, float]:
     """
-    Calculates necessary constants using max reynolds number of the system.
-    :param longitudinalPitch: float (mm)
-    :param transversePitch: float (mm)
+    Calculates necessary constants using max reynolds number of the system. Only the
+    pitch ratio is used, so the pitches just need matching units.
+    :param longitudinalPitch: float (m)
+    :param transversePitch: float (m)
     :param arrangement: string (aligned or staggered)
     :param maxReynolds: float (unitless)
     :return: Tuple [constantOne, constantTwo] (unitless)
@@ -123,117 +247,66 @@ def constantCalculation(maxReynolds: float, transversePitch: float, longitudinal
     constantOne = 0
     constantTwo = 0
     if arrangement == "aligned":
-        if 10 <= maxReynolds < 100:
-            constantOne = .8
-            constantTwo = .4
-
-        elif 100 <= maxReynolds < 1000:
-            constantOne = 0
-            constantTwo = 0
-
-        elif (1000 <= maxReynolds < 2 * (10 ** 5)) & (transversePitch / longitudinalPitch > .7):
-            constantOne = .27
-            constantTwo = .63
-
-        elif (1000 <= maxReynolds < 2 * (10 ** 5)) & (transversePitch / longitudinalPitch < .7):
-            print(
-                "aligned tubes are inefficient in this geometry case. A staggered arrangement should be used instead.")
-
-        elif 2 * (10 ** 5) <= maxReynolds < 2 * (10 ** 6):
-            constantOne = .021
-            constantTwo = .84
-
-        elif maxReynolds > 2 * (10 ** 6):
-            print("The Reynold's number for this case too large, try reducing flow rate")
-
-        elif maxReynolds < 10:
-            print("The Reynold's number for this case too small, try increasing flow rate")
-    if arrangement == "staggered":
-        if 10 <= maxReynolds < 100:
-            constantOne = .9
-            constantTwo = .4
-
-        elif 100 <= maxReynolds < 1000:
-            constantOne = 0
-            constantTwo = 0
-
-        elif (1000 <= maxReynolds < 2 * (10 ** 5)) & (transversePitch / longitudinalPitch < 2):
-            constantOne = .35 * ((transversePitch / longitudinalPitch) ** .2)
-            constantTwo = .6
-
-        elif (1000 <= maxReynolds < 2 * (10 ** 5)) & (transversePitch / longitudinalPitch > 2):
-            constantOne = .4
-            constantTwo = .6
-
-        elif 2 * (10 ** 5) <= maxReynolds < 2 * (10 ** 6):
-            constantOne = .022
-            constantTwo = .84
-
-        elif maxReynolds > 2 * (10 ** 6):
+        constantTable = _ALIGNED_CONSTANTS
+    elif arrangement == "staggered":
+        constantTable = _STAGGERED_CONSTANTS
+    else:
+        return constantOne, constantTwo
+    regime = bisect.bisect_right(_REYNOLDS_BREAKPOINTS, maxReynolds)
+    if regime == 0:
+        print("The Reynold's number for this case too small, try increasing flow rate")
+    elif regime == len(_REYNOLDS_BREAKPOINTS):
+        if maxReynolds > _REYNOLDS_HIGH:
             print("The Reynold's number for this case too large, try reducing flow rate")
-
-        elif maxReynolds < 10:
-            print("The Reynold's number for this case too small, try increasing flow rate")
+    elif constantTable[regime - 1] is not None:
+        constantOne, constantTwo = constantTable[regime - 1]
+    else:
+        pitchRatio = transversePitch / longitudinalPitch
+        if arrangement == "aligned":
+            if pitchRatio > .7:
+                constantOne = .27
+                constantTwo = .63
+            elif pitchRatio < .7:
+                print(
+                    "aligned tubes are inefficient in this geometry case. A staggered arrangement should be used instead.")
+        else:
+            if pitchRatio < 2:
+                constantOne = .35 * (pitchRatio ** .2)
+                constantTwo = .6
+            elif pitchRatio > 2:
+                constantOne = .4
+                constantTwo = .6
     return constantOne, constantTwo
 
 
-def calculateDynamicViscosity(surfaceTemp: float, freestreamTemp: float) -> float:
+@functools.lru_cache(maxsize=None)
+def calculateDynamicViscosity(filmTemperature: float) -> float:
     """
     Calculates dynamic viscosity at the film temperature of the system. Data taken from Engineering Toolbox website.
-    :param surfaceTemp: float (celsius)
-    :param freestreamTemp: float (celsius)
+    :param filmTemperature: float (celsius)
     :return: float (Ns/m^2)
     """
-    filmTemp = (surfaceTemp + freestreamTemp) / 2
-    celsiusDataPoints = [0,
-                         5,
-                         10,
-                         15,
-                         20,
-                         25,
-                         30,
-                         40,
-                         50,
-                         60,
-                         80,
-                         100,
-                         125]
-    dynamicViscosityDataPoints = [17.15,
-                                  17.40,
-                                  17.64,
-                                  17.89,
-                                  18.13,
-                                  18.37,
-                                  18.60,
-                                  19.07,
-                                  19.53,
-                                  19.99,
-                                  20.88,
-                                  21.74,
-                                  22.79]
-    dynamicViscosity = numpy.interp(filmTemp, celsiusDataPoints, dynamicViscosityDataPoints) * (10**(-6))
+    dynamicViscosity = _interp1d(filmTemperature, _DYNAMIC_VISCOSITY_TABLE)
     return dynamicViscosity
 
 
 def nusseltNumberCalculation(constantOne: float, constantTwo: float, maxReynolds: float, surfacePrandtl: float,
-                             freestreamPrandtl: float, surfaceTemperature: float, freestreamTemperature: float,
+                             freestreamPrandtl: float, filmPrandtl: float,
                              correctionFactor: float) -> float:
     """
     Calculation of the nusselt number for the given situation. If the constants given are both zero, the nusselt number
     for a cylinder is calculated.
     :param correctionFactor: float (unitless)
-    :param freestreamTemperature: float (celsius)
-    :param surfaceTemperature: float (celsius)
     :param constantOne: float (unitless)
     :param constantTwo: float (unitless)
     :param maxReynolds: float (unitless)
     :param surfacePrandtl: float (unitless)
     :param freestreamPrandtl: float (unitless)
+    :param filmPrandtl: float (unitless)
     :return: float (unitless)
     """
-    if (constantOne == 0) & (constantTwo == 0):
-        filmPrandtl = (prandtlNumberCalculation(0, 0, (surfaceTemperature + freestreamTemperature) / 2))[2]
-        nusselt = .683 * (maxReynolds ** .466) * (filmPrandtl ** 1 / 3)
+    if constantOne == 0 and constantTwo == 0:
+        nusselt = .683 * (maxReynolds ** .466) * (filmPrandtl ** _ONE_THIRD)
         return nusselt * correctionFactor
 
     nusselt = constantOne * (maxReynolds ** constantTwo) * (freestreamPrandtl ** .36) * (
@@ -241,41 +314,14 @@ def nusseltNumberCalculation(constantOne: float, constantTwo: float, maxReynolds
     return nusselt * correctionFactor
 
 
-def fluidThermalConductivityCalculation(surfaceTemperature: float, freestreamTemperature: float) -> float:
+@functools.lru_cache(maxsize=None)
+def fluidThermalConductivityCalculation(filmTemperature: float) -> float:
     """
     Calculates fluid thermal conductivity at the film temperature.
-    :param surfaceTemperature: float (celsius)
-    :param freestreamTemperature: float (celsius)
+    :param filmTemperature: float (celsius)
     :return: float (w/mk)
     """
-    filmTemperature = (surfaceTemperature + freestreamTemperature) / 2
-    celsiusDataPoints = [0,
-                         5,
-                         10,
-                         15,
-                         20,
-                         25,
-                         30,
-                         40,
-                         50,
-                         60,
-                         80,
-                         100,
-                         125]
-    thermalConductivityDataPoints = [24.36,
-                                     24.74,
-                                     25.12,
-                                     25.50,
-                                     25.87,
-                                     26.24,
-                                     26.62,
-                                     27.35,
-                                     28.08,
-                                     28.80,
-                                     30.23,
-                                     31.62,
-                                     33.33]
-    thermalConductivity = numpy.interp(filmTemperature, celsiusDataPoints, thermalConductivityDataPoints) / 1000
+    thermalConductivity = _interp1d(filmTemperature, _THERMAL_CONDUCTIVITY_TABLE)
     return thermalConductivity
 
 
@@ -284,80 +330,57 @@ def calculateAverageConvectiveCoefficient(fluidThermalConductivity: float, cellD
     """
     Calculates average convective heat transfer coefficient.
     :param fluidThermalConductivity: float (w/mk)
-    :param cellDiameter: float (mm)
+    :param cellDiameter: float (m)
     :param nusseltNumber: float (unitless)
     :return: float (w/m^2k)
     """
-    averageConvectiveCoef = nusseltNumber * fluidThermalConductivity / (cellDiameter/1000)
+    averageConvectiveCoef = nusseltNumber * fluidThermalConductivity / cellDiameter
     return averageConvectiveCoef
 
 
-def calculateFluidDensity(surfaceTemperature: float, freestreamTemperature: float) -> float:
+@functools.lru_cache(maxsize=None)
+def calculateFluidDensity(filmTemperature: float) -> float:
     """
-    Calculates density of the fluid.
-    :param surfaceTemperature: float (celsius)
-    :param freestreamTemperature: float (celsius)
+    Calculates density of the fluid at the film temperature.
+    :param filmTemperature: float (celsius)
     :return: float (kg/m^3)
     """
-    filmTemp = (surfaceTemperature + freestreamTemperature) / 2
-    celsiusDataPoints = [0,
-                         5,
-                         10,
-                         15,
-                         20,
-                         25,
-                         30,
-                         40,
-                         50,
-                         60,
-                         80,
-                         100,
-                         125]
-    densityDataPoints = [1.292,
-                         1.268,
-                         1.246,
-                         1.225,
-                         1.204,
-                         1.184,
-                         1.164,
-                         1.127,
-                         1.093,
-                         1.060,
-                         1.000,
-                         0.9467,
-                         0.8868]
-    fluidDensity = numpy.interp(filmTemp, celsiusDataPoints, densityDataPoints)
+    fluidDensity = _interp1d(filmTemperature, _DENSITY_TABLE)
     return fluidDensity
 
 
-def calculateFluidSpecificHeat(surfaceTemperature: float, freestreamTemperature: float) -> float:
+@functools.lru_cache(maxsize=None)
+def calculateFluidSpecificHeat(filmTemperature: float) -> float:
     """
     Calculate film temperature fluid specific heat.
-    :param surfaceTemperature: float (celsius)
-    :param freestreamTemperature: float (celsius)
+    :param filmTemperature: float (celsius)
     :return: float (J/KgK)
     """
-    filmTemperature = (surfaceTemperature + freestreamTemperature) / 2
-    celsiusDataPoints = [0.0,
-                         6.9,
-                         15.6,
-                         26.9,
-                         46.9,
-                         66.9,
-                         86.9,
-                         107,
-                         127]
-    specificHeatDataPoints = [1.006,
-                              1.006,
-                              1.006,
-                              1.006,
-                              1.007,
-                              1.009,
-                              1.010,
-                              1.012,
-                              1.014]
-    fluidSpecificHeat = numpy.interp(filmTemperature, celsiusDataPoints, specificHeatDataPoints)
-    return fluidSpecificHeat * 1000
+    fluidSpecificHeat = _interp1d(filmTemperature, _SPECIFIC_HEAT_TABLE)
+    return fluidSpecificHeat
+
+
+@functools.lru_cache(maxsize=None)
+def calculateFilmProperties(filmTemperature: float) -> typing.Tuple[float, float, float, float, float]:
+    """
+    Evaluates all five film temperature properties with one segment search over the
+    merged table, instead of five separate lookups at the same temperature.
+    :param filmTemperature: float (celsius)
+    :return: Tuple [density, dynamicViscosity, thermalConductivity, specificHeat, prandtl]
+             (kg/m^3, Ns/m^2, w/mk, J/KgK, unitless)
+    """
+    if filmTemperature <= _FILM_CELSIUS[0]:
+        filmTemperature = _FILM_CELSIUS[0]
+        i = 0
+    elif filmTemperature >= _FILM_CELSIUS[-1]:
+        filmTemperature = _FILM_CELSIUS[-1]
+        i = len(_FILM_CELSIUS) - 2
+    else:
+        i = bisect.bisect_right(_FILM_CELSIUS, filmTemperature) - 1
+    distance = filmTemperature - _FILM_CELSIUS[i]
+    density, dynamicViscosity, thermalConductivity, specificHeat, prandtl = \
+        (table[1][i] + table[2][i] * distance for table in _FILM_RESAMPLED)
+    return density, dynamicViscosity, thermalConductivity, specificHeat, prandtl
 
 
 def calculateExitTemp(cellDiameter: float, cellNumber: float,
@@ -368,20 +391,21 @@ def calculateExitTemp(cellDiameter: float, cellNumber: float,
     Calculates the exit temperature of the air through the battery pack.
     :param freestreamTemp: float (celsius)
     :param surfaceTemp: float (celsius)
-    :param cellDiameter: float (mm)
+    :param cellDiameter: float (m)
     :param cellNumber: float (unitless)
     :param averageConvectiveCoef: float (w/m^2K)
     :param filmTempDensity: float (kg/m^3)
     :param freestreamVelocity: float (m/s)
     :param cellNumberTransverse: float (unitless)
-    :param transversePitch: float (mm)
+    :param transversePitch: float (m)
     :param filmTempSpecificHeat: float (J/kgK)
     :return: float (celsius)
     """
-    exitTemp = -((exp(
-        (-3.14159 * cellDiameter / 1000 * cellNumber * averageConvectiveCoef) / (filmTempDensity * freestreamVelocity *
-                                                                                 cellNumberTransverse * transversePitch
-                                                                                 / 1000 * filmTempSpecificHeat)) * (surfaceTemp-freestreamTemp)) - surfaceTemp)
+    transferUnits = (pi * cellDiameter * cellNumber * averageConvectiveCoef) / (filmTempDensity * freestreamVelocity *
+                                                                                cellNumberTransverse * transversePitch
+                                                                                * filmTempSpecificHeat)
+    # expm1 keeps precision when transferUnits is small, where exp(-x) - 1 would cancel.
+    exitTemp = freestreamTemp - (surfaceTemp - freestreamTemp) * expm1(-transferUnits)
     return exitTemp
 
 
@@ -407,11 +431,9 @@ def calculateTotalHeatTransfer(cellNumber: float, averageConvectiveCoef: float,
     :param cellLength: float (m)
     :param cellNumber: float (unitless)
     :param averageConvectiveCoef: float (w/m^2K)
-    :param cellDiameter: float (mm)
+    :param cellDiameter: float (m)
     :param logMeanTempDif: float (celsius)
     :return: float (W)
     """
-    totalHeatTransfer = cellNumber * averageConvectiveCoef * 3.14159 * cellDiameter/1000 * logMeanTempDif * cellLength
+    totalHeatTransfer = cellNumber * averageConvectiveCoef * pi * cellDiameter * logMeanTempDif * cellLength
     return totalHeatTransfer
-
-